@@ -32,7 +32,6 @@ setup(
         "requests",
         "requests-toolbelt",
         "six",
-        "tabulate",
         "tzlocal",
         'futures; python_version<"3"',
         'importlib_metadata; python_version<"3.8"',
@@ -19,6 +19,11 @@ from builtins import *
 
 import logging
 import os
+import stat
+import sys
+import threading
+
+import six
 
 from voxel51.users.auth import Token, TokenError
 import voxel51.users.utils as voxu
@@ -33,9 +38,19 @@ BASE_API_URL_ENV_VAR = "VOXEL51_APP_BASE_URL"
 
 KEY_HEADER = "x-voxel51-application"
 USER_HEADER = "x-voxel51-application-user"
+if six.PY3:
+    # Header keys are inserted into a dict on every request
+    KEY_HEADER = sys.intern(KEY_HEADER)
+    USER_HEADER = sys.intern(USER_HEADER)
+
 TOKEN_PATH = os.path.join(
     os.path.expanduser("~"), ".voxel51", "app-token.json")
 
+# The most recently loaded token file, as a `((path, mtime, size), token)`
+# tuple, so that repeated `ApplicationAPI()` constructions need not re-read it
+_cached_token = None
+_cached_token_lock = threading.Lock()
+
 
 def activate_application_token(path):
     '''Activates the application token by copying it to
@@ -48,6 +63,7 @@ def activate_application_token(path):
         path (str): the path to an :class:`ApplicationToken` JSON file
     '''
     voxu.copy_file(path, TOKEN_PATH)
+    _clear_cached_token()
     logger.info("ApplicationToken successfully activated")
 
 
@@ -56,6 +72,7 @@ def deactivate_application_token():
 
     The active application token is at ``~/.voxel51/app-token.json``.
     '''
+    _clear_cached_token()
     try:
         os.remove(TOKEN_PATH)
         logger.info(
@@ -77,19 +94,9 @@ def get_active_application_token_path():
     Returns:
         the path to the active application token, or None if no token was found
     '''
-    private_key = os.environ.get(PRIVATE_KEY_ENV_VAR, None)
-    if private_key:
-        return None
-
-    token_path = os.environ.get(TOKEN_ENV_VAR, None)
-    if token_path is not None:
-        if not os.path.isfile(token_path):
-            raise ApplicationTokenError(
-                "No file found at '%s=%s'" % (TOKEN_ENV_VAR, token_path))
-    elif os.path.isfile(TOKEN_PATH):
-        token_path = TOKEN_PATH
-
-    return token_path
+    env = os.environ
+    return _get_active_application_token_path(
+        env.get(PRIVATE_KEY_ENV_VAR, None), env.get(TOKEN_ENV_VAR, None))
 
 
 def load_application_token(token_path=None):
@@ -104,6 +111,9 @@ def load_application_token(token_path=None):
         (3) Use the ``VOXEL51_APP_TOKEN`` environment variable
         (4) Load the active token from ``~/.voxel51/app-token.json``
 
+    Tokens loaded from disk are cached, so repeated calls return the same
+    :class:`ApplicationToken` instance until the underlying file is modified.
+
     Args:
         token_path (str, optional): the path to a :class:`ApplicationToken`
             JSON file. If no path is provided, the active token is loaded using
@@ -120,29 +130,87 @@ def load_application_token(token_path=None):
         return _load_application_token_from_path(token_path)
 
     # Load token from environment variables, if possible
-    private_key = os.environ.get(PRIVATE_KEY_ENV_VAR, None)
+    env = os.environ
+    private_key = env.get(PRIVATE_KEY_ENV_VAR, None)
     if private_key:
-        base_api_url = os.environ.get(BASE_API_URL_ENV_VAR, None)
+        base_api_url = env.get(BASE_API_URL_ENV_VAR, None)
         return ApplicationToken.from_private_key(
             private_key, base_api_url=base_api_url)
 
-    # Try to load token from path
-    token_path = get_active_application_token_path()
+    # Try to load token from `VOXEL51_APP_TOKEN`
+    token_path = env.get(TOKEN_ENV_VAR, None)
     if token_path is not None:
-        return _load_application_token_from_path(token_path)
+        token = _read_application_token(token_path)
+        if token is None:
+            raise ApplicationTokenError(
+                "No file found at '%s=%s'" % (TOKEN_ENV_VAR, token_path))
+        return token
+
+    # Try to load active token
+    token = _read_application_token(TOKEN_PATH)
+    if token is None:
+        raise ApplicationTokenError("No application token found")
+    return token
+
+
+def _get_active_application_token_path(private_key, token_path):
+    if private_key:
+        return None
 
-    raise ApplicationTokenError("No application token found")
+    if token_path is not None:
+        if not os.path.isfile(token_path):
+            raise ApplicationTokenError(
+                "No file found at '%s=%s'" % (TOKEN_ENV_VAR, token_path))
+    elif os.path.isfile(TOKEN_PATH):
+        token_path = TOKEN_PATH
+
+    return token_path
 
 
 def _load_application_token_from_path(token_path):
-    if not os.path.isfile(token_path):
+    token = _read_application_token(token_path)
+    if token is None:
         raise ApplicationTokenError("No file found at '%s'" % token_path)
+    return token
+
+
+def _read_application_token(token_path):
+    # Returns None, rather than raising, if no token file exists at the path
+    global _cached_token
 
     try:
-        return ApplicationToken.from_json(token_path)
-    except IOError:
-        raise ApplicationTokenError(
-            "File '%s' is not a valid application token" % token_path)
+        st = os.stat(token_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    key = (os.path.abspath(token_path), st.st_mtime, st.st_size)
+
+    cached = _cached_token
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with _cached_token_lock:
+        cached = _cached_token
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            token = ApplicationToken.from_json(token_path)
+        except IOError:
+            raise ApplicationTokenError(
+                "File '%s' is not a valid application token" % token_path)
+
+        _cached_token = (key, token)
+        return token
+
+
+def _clear_cached_token():
+    global _cached_token
+
+    with _cached_token_lock:
+        _cached_token = None
 
 
 class ApplicationToken(Token):
@@ -166,11 +234,14 @@ class ApplicationToken(Token):
         Returns:
             a header dictionary
         '''
-        header = {KEY_HEADER: self.private_key}
+        header = self._header.copy()
         if username:
             header[USER_HEADER] = username
         return header
 
+    def _make_header(self):
+        return {KEY_HEADER: self.private_key}
+
 
 class ApplicationTokenError(TokenError):
     '''Exception raised when a problem with an :class:`ApplicationToken` is
@@ -14,30 +14,86 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 from builtins import *
-from future.utils import iteritems, itervalues
 # pragma pylint: enable=redefined-builtin
 # pragma pylint: enable=unused-wildcard-import
 # pragma pylint: enable=wildcard-import
 
 import argparse
+from datetime import datetime
+import hashlib
+import importlib
 import json
+import operator
+import os
+import shutil
 import sys
-
-import argcomplete
-import dateutil.parser
-from tabulate import tabulate
-from tzlocal import get_localzone
+import threading
+import time
 
 import voxel51.constants as voxc
-from voxel51.users.api import API
-import voxel51.users.auth as voxa
-from voxel51.users.jobs import JobRequest, JobState
-from voxel51.users.query import AnalyticsQuery, DataQuery, JobsQuery
-import voxel51.users.utils as voxu
 
 
 _MAX_NAME_COLUMN_WIDTH = 51
-_TABLE_FORMAT = "simple"
+_ELLIPSIS = " ..."
+_TRUNCATED_NAME_WIDTH = _MAX_NAME_COLUMN_WIDTH - len(_ELLIPSIS)
+
+# The fields shown by the list commands, unless all fields are requested
+_DATA_TABLE_FIELDS = (
+    "id", "name", "size", "type", "upload_date", "expiration_date")
+_JOBS_TABLE_FIELDS = (
+    "id", "name", "state", "archived", "upload_date", "expiration_date",
+    "expired")
+_ANALYTICS_TABLE_FIELDS = (
+    "id", "name", "version", "scope", "supports_cpu", "supports_gpu",
+    "pending", "upload_date")
+
+# Searches that override the default archived/pending filters of list commands
+_ARCHIVED_SEARCH = "archived:"
+_PENDING_SEARCH = "pending:"
+
+# `voxel51 jobs list` flags that select jobs in the `JobState` of the same name
+_JOB_STATE_FLAGS = (
+    "ready", "queued", "scheduled", "running", "complete", "failed")
+
+# The `(token key, API)` shared by all commands; see `_get_api()`
+_api = None
+
+# The local timezone used to render dates; see `_get_local_timezone()`
+_local_timezone = None
+
+# The format in which dates are rendered; see `_render_datetime()`
+_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S %Z"
+_fromisoformat = getattr(datetime, "fromisoformat", None)
+
+# Memo of rendered dates, bounded so that huge tables cannot grow it forever
+_rendered_datetimes = {}
+_MAX_RENDERED_DATETIMES = 4096
+
+# Local cache of read-only API responses; see `_get_cached_batch_response()`
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".voxel51", "cache")
+_CACHE_TTL = 300  # in seconds
+
+# List query results go stale faster, so they are cached for less time. The
+# TTL can be overridden by this environment variable
+_QUERY_CACHE_TTL_ENV_VAR = "VOXEL51_QUERY_CACHE_TTL"
+_QUERY_CACHE_TTL = 60  # in seconds
+
+# The maximum number of IDs to send in each batch request, and the number of
+# batch requests to run in parallel; see `_batch_request_in_chunks()`
+_BATCH_CHUNK_SIZE = 500
+_BATCH_MAX_WORKERS = 8
+
+# The number of table lines to write to stdout at a time
+_PRINT_CHUNK_SIZE = 1000
+
+# The SDK modules to import in the background when running each command
+_PREFETCH_MODULES = {
+    "auth": "voxel51.users.auth",
+    "data": "voxel51.users.api",
+    "jobs": "voxel51.users.api",
+    "analytics": "voxel51.users.api",
+    "status": "voxel51.users.api",
+}
 
 
 class Command(object):
@@ -75,11 +131,14 @@ class Voxel51Command(Command):
     @staticmethod
     def setup(parser):
         subparsers = parser.add_subparsers(title="available commands")
-        _register_command(subparsers, "auth", AuthCommand)
-        _register_command(subparsers, "data", DataCommand)
-        _register_command(subparsers, "jobs", JobsCommand)
-        _register_command(subparsers, "analytics", AnalyticsCommand)
-        _register_command(subparsers, "status", StatusCommand)
+        _register_commands(subparsers, [
+            ("auth", AuthCommand),
+            ("data", DataCommand),
+            ("jobs", JobsCommand),
+            ("analytics", AnalyticsCommand),
+            ("status", StatusCommand),
+            ("cache", CacheCommand),
+        ], level=0)
 
     @staticmethod
     def execute(parser, args):
@@ -92,9 +151,11 @@ class AuthCommand(Command):
     @staticmethod
     def setup(parser):
         subparsers = parser.add_subparsers(title="available commands")
-        _register_command(subparsers, "show", ShowAuthCommand)
-        _register_command(subparsers, "activate", ActivateAuthCommand)
-        _register_command(subparsers, "deactivate", DeactivateAuthCommand)
+        _register_commands(subparsers, [
+            ("show", ShowAuthCommand),
+            ("activate", ActivateAuthCommand),
+            ("deactivate", DeactivateAuthCommand),
+        ], level=1)
 
     @staticmethod
     def execute(parser, args):
@@ -132,6 +193,8 @@ class ActivateAuthCommand(Command):
 
     @staticmethod
     def execute(parser, args):
+        import voxel51.users.auth as voxa
+
         voxa.activate_token(args.token)
 
 
@@ -144,6 +207,8 @@ class DeactivateAuthCommand(Command):
 
     @staticmethod
     def execute(parser, args):
+        import voxel51.users.auth as voxa
+
         voxa.deactivate_token()
 
 
@@ -153,13 +218,15 @@ class DataCommand(Command):
     @staticmethod
     def setup(parser):
         subparsers = parser.add_subparsers(title="available commands")
-        _register_command(subparsers, "list", ListDataCommand)
-        _register_command(subparsers, "info", InfoDataCommand)
-        _register_command(subparsers, "upload", UploadDataCommand)
-        _register_command(subparsers, "post-url", PostURLDataCommand)
-        _register_command(subparsers, "download", DownloadDataCommand)
-        _register_command(subparsers, "ttl", TTLDataCommand)
-        _register_command(subparsers, "delete", DeleteDataCommand)
+        _register_commands(subparsers, [
+            ("list", ListDataCommand),
+            ("info", InfoDataCommand),
+            ("upload", UploadDataCommand),
+            ("post-url", PostURLDataCommand),
+            ("download", DownloadDataCommand),
+            ("ttl", TTLDataCommand),
+            ("delete", DeleteDataCommand),
+        ], level=1)
 
     @staticmethod
     def execute(parser, args):
@@ -218,8 +285,9 @@ class ListDataCommand(Command):
             "-s", "--search", metavar="SEARCH",
             help="search to limit results when listing data")
         parser.add_argument(
-            "--sort-by", metavar="FIELD",
-            help="field to sort by when listing data")
+            "--sort-by", metavar="FIELD", default="upload_date",
+            help="field to sort by when listing data. The default is "
+            "upload_date")
         parser.add_argument(
             "--ascending", action="store_true",
             help="whether to sort in ascending order")
@@ -229,26 +297,23 @@ class ListDataCommand(Command):
         parser.add_argument(
             "-c", "--count", action="store_true",
             help="whether to show the number of data in the list")
+        parser.add_argument(
+            "--no-format", action="store_true",
+            help="whether to print tab-separated fields with no header or "
+            "alignment")
 
     @staticmethod
     def execute(parser, args):
-        api = API()
-
-        query = DataQuery().add_all_fields()
+        from voxel51.users.query import DataQuery
 
-        if args.limit >= 0:
-            query = query.set_limit(args.limit)
+        api = _get_api()
 
-        sort_field = args.sort_by if args.sort_by else "upload_date"
-        descending = not args.ascending
-        query = query.sort_by(sort_field, descending=descending)
-
-        if args.search is not None:
-            query = query.add_search_direct(args.search)
+        query = _make_list_query(DataQuery, args)
 
         data = api.query_data(query)["data"]
         _print_data_table(
-            data, show_count=args.count, show_all_fields=args.all_fields)
+            data, show_count=args.count, show_all_fields=args.all_fields,
+            no_format=args.no_format)
 
 
 class InfoDataCommand(Command):
@@ -269,12 +334,17 @@ class InfoDataCommand(Command):
         parser.add_argument(
             "-a", "--all-fields", action="store_true",
             help="whether to print all available fields")
+        parser.add_argument(
+            "--no-cache", action="store_true",
+            help="whether to bypass the local cache of data details")
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
-        response = api.batch_get_data_details(args.ids)
+        response = _get_cached_batch_response(
+            api, "data", args.ids, api.batch_get_data_details,
+            use_cache=not args.no_cache)
 
         _log_batch_response(
             response, success_message=None,
@@ -299,27 +369,53 @@ class UploadDataCommand(Command):
         parser.add_argument(
             "--print-id", action="store_true",
             help="whether to print only the ID(s) of the uploaded data")
+        parser.add_argument(
+            "--num-workers", metavar="N", type=int, default=4,
+            help="the number of files to upload in parallel. The default is "
+            "4")
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        from voxel51.users.api import APIError
 
-        uploads = []
-        for path in args.paths:
+        api = _get_api()
+
+        # Failures are returned rather than raised, so that one bad path does
+        # not hide the files that the other workers uploaded
+        def _upload_data(path):
             if not args.print_id:
                 print("Uploading data '%s'" % path)
 
-            metadata = api.upload_data(path)
+            try:
+                return api.upload_data(path), None
+            except (APIError, IOError, OSError) as e:
+                return None, e
 
-            if args.print_id:
-                print(metadata["id"])
+        num_workers = max(1, min(args.num_workers, len(args.paths)))
+        results = api.thread_map(
+            _upload_data, args.paths, max_workers=num_workers)
+
+        uploads = []
+        failures = []
+        for path, (metadata, error) in zip(args.paths, results):
+            if error is not None:
+                failures.append((path, error))
             else:
                 metadata["path"] = path
                 uploads.append(metadata)
 
-        if not args.print_id:
+        if args.print_id:
+            _print_ids(metadata["id"] for metadata in uploads)
+        elif uploads:
             _print_data_uploads(uploads)
 
+        if failures:
+            # Written to stderr so that `--print-id` output stays parseable
+            sys.stderr.write("".join(
+                "Failed to upload data '%s': %s\n" % (path, error)
+                for path, error in failures))
+            sys.exit(1)
+
 
 class PostURLDataCommand(Command):
     '''Posts data via URL to the platform.
@@ -358,7 +454,7 @@ class PostURLDataCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
         metadata = api.post_data_as_url(
             args.url, args.filename, args.mime_type, args.size,
@@ -395,7 +491,7 @@ class DownloadDataCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
         data_id = args.id
 
@@ -422,7 +518,8 @@ class TTLDataCommand(Command):
     @staticmethod
     def setup(parser):
         parser.add_argument(
-            "ids", nargs="*", metavar="ID", help="the data ID(s) to update")
+            "ids", nargs="*", metavar="ID", default=[],
+            help="the data ID(s) to update")
         parser.add_argument(
             "--days", metavar="DAYS", type=float,
             help="the number of days by which to extend the TTL of the data")
@@ -441,21 +538,23 @@ class TTLDataCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        from voxel51.users.query import DataQuery
 
         if not args.days and not args.date:
             return
 
         if args.all:
-            data_ids = [data["id"] for data in api.list_data()]
+            api = _get_api()
+            query = _make_all_query(DataQuery)
+            data_ids = (data["id"] for data in api.iter_query_data(query))
         else:
-            data_ids = args.ids or []
+            data_ids = args.ids
 
         if args.dry_run:
-            for data_id in data_ids:
-                print(data_id)
+            _print_ids(_iter_unique(data_ids))
             return
 
+        data_ids = list(_iter_unique(data_ids))
         num_data = len(data_ids)
 
         if args.all:
@@ -466,8 +565,11 @@ class TTLDataCommand(Command):
         if num_data == 0:
             return
 
-        response = api.batch_update_data_ttl(
-            data_ids, days=args.days, expiration_date=args.date)
+        api = _get_api()
+        response = _batch_request_in_chunks(
+            api.batch_update_data_ttl, data_ids, days=args.days,
+            expiration_date=args.date)
+        _cache_clear()
 
         _log_batch_response(
             response, success_message="data TTL(s) updated",
@@ -488,7 +590,8 @@ class DeleteDataCommand(Command):
     @staticmethod
     def setup(parser):
         parser.add_argument(
-            "ids", nargs="*", metavar="ID", help="the data ID(s) to delete")
+            "ids", nargs="*", metavar="ID", default=[],
+            help="the data ID(s) to delete")
         parser.add_argument(
             "-a", "--all", action="store_true",
             help="whether to delete all data")
@@ -502,18 +605,20 @@ class DeleteDataCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        from voxel51.users.query import DataQuery
 
         if args.all:
-            data_ids = [data["id"] for data in api.list_data()]
+            api = _get_api()
+            query = _make_all_query(DataQuery)
+            data_ids = (data["id"] for data in api.iter_query_data(query))
         else:
-            data_ids = args.ids or []
+            data_ids = args.ids
 
         if args.dry_run:
-            for data_id in data_ids:
-                print(data_id)
+            _print_ids(_iter_unique(data_ids))
             return
 
+        data_ids = list(_iter_unique(data_ids))
         num_data = len(data_ids)
 
         if args.all:
@@ -524,7 +629,9 @@ class DeleteDataCommand(Command):
         if num_data == 0:
             return
 
-        response = api.batch_delete_data(data_ids)
+        api = _get_api()
+        response = _batch_request_in_chunks(api.batch_delete_data, data_ids)
+        _cache_clear()
 
         _log_batch_response(
             response, success_message="data deleted",
@@ -537,19 +644,22 @@ class JobsCommand(Command):
     @staticmethod
     def setup(parser):
         subparsers = parser.add_subparsers(title="available commands")
-        _register_command(subparsers, "list", ListJobsCommand)
-        _register_command(subparsers, "info", InfoJobsCommand)
-        _register_command(subparsers, "upload", UploadJobsCommand)
-        _register_command(subparsers, "start", StartJobsCommand)
-        _register_command(subparsers, "archive", ArchiveJobsCommand)
-        _register_command(subparsers, "unarchive", UnarchiveJobsCommand)
-        _register_command(subparsers, "ttl", TTLJobsCommand)
-        _register_command(subparsers, "request", RequestJobsCommand)
-        _register_command(subparsers, "status", StatusJobsCommand)
-        _register_command(subparsers, "log", LogJobsCommand)
-        _register_command(subparsers, "download", DownloadJobsCommand)
-        _register_command(subparsers, "kill", KillJobsCommand)
-        _register_command(subparsers, "delete", DeleteJobsCommand)
+        _register_commands(subparsers, [
+            ("list", ListJobsCommand),
+            ("info", InfoJobsCommand),
+            ("upload", UploadJobsCommand),
+            ("start", StartJobsCommand),
+            ("archive", ArchiveJobsCommand),
+            ("unarchive", UnarchiveJobsCommand),
+            ("ttl", TTLJobsCommand),
+            ("request", RequestJobsCommand),
+            ("status", StatusJobsCommand),
+            ("log", LogJobsCommand),
+            ("download", DownloadJobsCommand),
+            ("fetch", FetchJobsCommand),
+            ("kill", KillJobsCommand),
+            ("delete", DeleteJobsCommand),
+        ], level=1)
 
     @staticmethod
     def execute(parser, args):
@@ -631,8 +741,9 @@ class ListJobsCommand(Command):
             "-s", "--search", metavar="SEARCH",
             help="search to limit results when listing jobs")
         parser.add_argument(
-            "--sort-by", metavar="FIELD",
-            help="field to sort by when listing jobs")
+            "--sort-by", metavar="FIELD", default="upload_date",
+            help="field to sort by when listing jobs. The default is "
+            "upload_date")
         parser.add_argument(
             "--ascending", action="store_true",
             help="whether to sort in ascending order")
@@ -642,20 +753,16 @@ class ListJobsCommand(Command):
         parser.add_argument(
             "-c", "--count", action="store_true",
             help="whether to show the number of jobs in the list")
+        parser.add_argument(
+            "--no-format", action="store_true",
+            help="whether to print tab-separated fields with no header or "
+            "alignment")
 
         states = parser.add_argument_group("state arguments")
-        states.add_argument(
-            "--ready", action="store_true", help="jobs in READY state")
-        states.add_argument(
-            "--queued", action="store_true", help="jobs in QUEUED state")
-        states.add_argument(
-            "--scheduled", action="store_true", help="jobs in SCHEDULED state")
-        states.add_argument(
-            "--running", action="store_true", help="jobs in RUNNING state")
-        states.add_argument(
-            "--complete", action="store_true", help="jobs in COMPLETE state")
-        states.add_argument(
-            "--failed", action="store_true", help="jobs in FAILED state")
+        for flag in _JOB_STATE_FLAGS:
+            states.add_argument(
+                "--" + flag, action="store_true",
+                help="jobs in %s state" % flag.upper())
 
         archival = parser.add_argument_group("archival arguments")
         archival.add_argument(
@@ -679,37 +786,21 @@ class ListJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
-
-        query = JobsQuery().add_all_fields()
-
-        if args.limit >= 0:
-            query = query.set_limit(args.limit)
-
-        sort_field = args.sort_by if args.sort_by else "upload_date"
-        descending = not args.ascending
-        query = query.sort_by(sort_field, descending=descending)
-
-        states = []
-        if args.ready:
-            states.append(JobState.READY)
-        if args.queued:
-            states.append(JobState.QUEUED)
-        if args.scheduled:
-            states.append(JobState.SCHEDULED)
-        if args.running:
-            states.append(JobState.RUNNING)
-        if args.complete:
-            states.append(JobState.COMPLETE)
-        if args.failed:
-            states.append(JobState.FAILED)
+        from voxel51.users.jobs import JobState
+        from voxel51.users.query import JobsQuery
+
+        api = _get_api()
+
+        query = _make_list_query(JobsQuery, args)
+
+        states = [
+            getattr(JobState, flag.upper()) for flag in _JOB_STATE_FLAGS
+            if getattr(args, flag)]
         if states:
             query = query.add_search_or("state", states)
 
-        if args.search is not None:
-            query = query.add_search_direct(args.search)
-
-        if args.search is None or "archived:" not in args.search:
+        search = args.search
+        if search is None or _ARCHIVED_SEARCH not in search:
             # default: exclude archived
             if args.archived_only:
                 query = query.add_search("archived", True)
@@ -725,7 +816,8 @@ class ListJobsCommand(Command):
         jobs = api.query_jobs(query)["jobs"]
 
         _print_jobs_table(
-            jobs, show_count=args.count, show_all_fields=args.all_fields)
+            jobs, show_count=args.count, show_all_fields=args.all_fields,
+            no_format=args.no_format)
 
 
 class InfoJobsCommand(Command):
@@ -749,7 +841,7 @@ class InfoJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
         response = api.batch_get_job_details(args.ids)
 
@@ -788,7 +880,9 @@ class UploadJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        from voxel51.users.jobs import JobRequest
+
+        api = _get_api()
 
         request = JobRequest.from_json(args.request)
         metadata = api.upload_job_request(
@@ -817,7 +911,8 @@ class StartJobsCommand(Command):
     @staticmethod
     def setup(parser):
         parser.add_argument(
-            "ids", nargs="*", metavar="ID", help="the job ID(s) to start")
+            "ids", nargs="*", metavar="ID", default=[],
+            help="the job ID(s) to start")
         parser.add_argument(
             "-a", "--all", action="store_true",
             help="whether to start all eligible (unstarted) jobs")
@@ -831,24 +926,22 @@ class StartJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        from voxel51.users.jobs import JobState
+        from voxel51.users.query import JobsQuery
 
         if args.all:
-            query = (JobsQuery()
-                .add_all_fields()
-                .add_search("state", JobState.READY)
-                .add_search("archived", False)
-                .sort_by("upload_date", descending=False))
-            jobs = api.query_jobs(query)["jobs"]
-            job_ids = [job["id"] for job in jobs]
+            api = _get_api()
+            query = _make_all_query(
+                JobsQuery, state=JobState.READY, archived=False)
+            job_ids = (job["id"] for job in api.iter_query_jobs(query))
         else:
             job_ids = args.ids
 
         if args.dry_run:
-            for job_id in job_ids:
-                print(job_id)
+            _print_ids(_iter_unique(job_ids))
             return
 
+        job_ids = list(_iter_unique(job_ids))
         num_jobs = len(job_ids)
 
         if args.all:
@@ -859,7 +952,8 @@ class StartJobsCommand(Command):
         if num_jobs == 0:
             return
 
-        response = api.batch_start_jobs(job_ids)
+        api = _get_api()
+        response = _batch_request_in_chunks(api.batch_start_jobs, job_ids)
 
         _log_batch_response(
             response, success_message="job(s) started",
@@ -880,7 +974,8 @@ class ArchiveJobsCommand(Command):
     @staticmethod
     def setup(parser):
         parser.add_argument(
-            "ids", nargs="*", metavar="ID", help="the job ID(s) to archive")
+            "ids", nargs="*", metavar="ID", default=[],
+            help="the job ID(s) to archive")
         parser.add_argument(
             "-a", "--all", action="store_true",
             help="whether to archive all jobs")
@@ -894,23 +989,20 @@ class ArchiveJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        from voxel51.users.query import JobsQuery
 
         if args.all:
-            query = (JobsQuery()
-                .add_all_fields()
-                .add_search("archived", False)
-                .sort_by("upload_date", descending=False))
-            jobs = api.query_jobs(query)["jobs"]
-            job_ids = [job["id"] for job in jobs]
+            api = _get_api()
+            query = _make_all_query(JobsQuery, archived=False)
+            job_ids = (job["id"] for job in api.iter_query_jobs(query))
         else:
             job_ids = args.ids
 
         if args.dry_run:
-            for job_id in job_ids:
-                print(job_id)
+            _print_ids(_iter_unique(job_ids))
             return
 
+        job_ids = list(_iter_unique(job_ids))
         num_jobs = len(job_ids)
 
         if args.all:
@@ -921,7 +1013,8 @@ class ArchiveJobsCommand(Command):
         if num_jobs == 0:
             return
 
-        response = api.batch_archive_jobs(job_ids)
+        api = _get_api()
+        response = _batch_request_in_chunks(api.batch_archive_jobs, job_ids)
 
         _log_batch_response(
             response, success_message="job(s) archived",
@@ -942,7 +1035,8 @@ class UnarchiveJobsCommand(Command):
     @staticmethod
     def setup(parser):
         parser.add_argument(
-            "ids", nargs="*", metavar="ID", help="the job ID(s) to unarchive")
+            "ids", nargs="*", metavar="ID", default=[],
+            help="the job ID(s) to unarchive")
         parser.add_argument(
             "-a", "--all", action="store_true",
             help="whether to unarchive all eligible (unexpired) jobs")
@@ -956,24 +1050,20 @@ class UnarchiveJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        from voxel51.users.query import JobsQuery
 
         if args.all:
-            query = (JobsQuery()
-                .add_all_fields()
-                .add_search("archived", True)
-                .add_search("expired", False)
-                .sort_by("upload_date", descending=False))
-            jobs = api.query_jobs(query)["jobs"]
-            job_ids = [job["id"] for job in jobs]
+            api = _get_api()
+            query = _make_all_query(JobsQuery, archived=True, expired=False)
+            job_ids = (job["id"] for job in api.iter_query_jobs(query))
         else:
             job_ids = args.ids
 
         if args.dry_run:
-            for job_id in job_ids:
-                print(job_id)
+            _print_ids(_iter_unique(job_ids))
             return
 
+        job_ids = list(_iter_unique(job_ids))
         num_jobs = len(job_ids)
 
         if args.all:
@@ -984,7 +1074,9 @@ class UnarchiveJobsCommand(Command):
         if num_jobs == 0:
             return
 
-        response = api.batch_unarchive_jobs(job_ids)
+        api = _get_api()
+        response = _batch_request_in_chunks(
+            api.batch_unarchive_jobs, job_ids)
 
         _log_batch_response(
             response, success_message="job(s) unarchived",
@@ -1005,7 +1097,8 @@ class TTLJobsCommand(Command):
     @staticmethod
     def setup(parser):
         parser.add_argument(
-            "ids", nargs="*", metavar="ID", help="the job ID(s) to update")
+            "ids", nargs="*", metavar="ID", default=[],
+            help="the job ID(s) to update")
         parser.add_argument(
             "--days", metavar="DAYS", type=float,
             help="the number of days by which to extend the TTL of the jobs")
@@ -1024,26 +1117,23 @@ class TTLJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        from voxel51.users.query import JobsQuery
 
         if not args.days and not args.date:
             return
 
         if args.all:
-            query = (JobsQuery()
-                .add_all_fields()
-                .add_search("expired", False)
-                .sort_by("upload_date", descending=False))
-            jobs = api.query_jobs(query)["jobs"]
-            job_ids = [job["id"] for job in jobs]
+            api = _get_api()
+            query = _make_all_query(JobsQuery, expired=False)
+            job_ids = (job["id"] for job in api.iter_query_jobs(query))
         else:
             job_ids = args.ids
 
         if args.dry_run:
-            for job_id in job_ids:
-                print(job_id)
+            _print_ids(_iter_unique(job_ids))
             return
 
+        job_ids = list(_iter_unique(job_ids))
         num_jobs = len(job_ids)
 
         if args.all:
@@ -1054,8 +1144,10 @@ class TTLJobsCommand(Command):
         if num_jobs == 0:
             return
 
-        response = api.batch_update_jobs_ttl(
-            job_ids, days=args.days, expiration_date=args.date)
+        api = _get_api()
+        response = _batch_request_in_chunks(
+            api.batch_update_jobs_ttl, job_ids, days=args.days,
+            expiration_date=args.date)
 
         _log_batch_response(
             response, success_message="job TTL(s) updated",
@@ -1081,7 +1173,7 @@ class RequestJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
         request = api.get_job_request(args.id)
 
@@ -1112,7 +1204,9 @@ class StatusJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        import voxel51.users.utils as voxu
+
+        api = _get_api()
 
         status = api.get_job_status(args.id)
 
@@ -1148,7 +1242,7 @@ class LogJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
         if args.url:
             url = api.get_job_logfile_download_url(args.id)
@@ -1188,10 +1282,14 @@ class DownloadJobsCommand(Command):
         parser.add_argument(
             "-u", "--url", action="store_true",
             help="generate signed URL to download job output")
+        parser.add_argument(
+            "--streams", metavar="N", type=int, default=1,
+            help="the number of parallel range requests to use to download "
+            "the output. The default is 1")
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
         job_id = args.download
 
@@ -1200,10 +1298,74 @@ class DownloadJobsCommand(Command):
             print(url)
             return
 
-        output_path = api.download_job_output(job_id, output_path=args.path)
+        output_path = api.download_job_output(
+            job_id, output_path=args.path, num_streams=max(1, args.streams))
         print("Downloaded '%s' to '%s'" % (job_id, output_path))
 
 
+class FetchJobsCommand(Command):
+    '''Download job outputs and logfiles together.
+
+    Notes:
+        The output and logfile are downloaded in parallel. Logfiles can only
+        be downloaded for jobs that run private analytics.
+
+    Examples:
+        # Download job output and logfile to default locations
+        voxel51 jobs fetch <id>
+
+        # Download job output and logfile to specific locations
+        voxel51 jobs fetch <id> \\
+            --path '/path/for/job/output.json' \\
+            --log-path '/path/for/job.log'
+    '''
+
+    @staticmethod
+    def setup(parser):
+        parser.add_argument("id", metavar="ID", help="the job ID of interest")
+        parser.add_argument(
+            "-p", "--path", metavar="PATH", help="path to write output")
+        parser.add_argument(
+            "--log-path", metavar="PATH",
+            help="path to write logfile. The default is `<id>.log`")
+
+    @staticmethod
+    def execute(parser, args):
+        from voxel51.users.api import APIError
+
+        api = _get_api()
+
+        job_id = args.id
+        log_path = args.log_path or job_id + ".log"
+
+        def _download_output():
+            output_path = api.download_job_output(
+                job_id, output_path=args.path)
+            print("Downloaded '%s' to '%s'" % (job_id, output_path))
+
+        def _download_logfile():
+            api.download_job_logfile(job_id, output_path=log_path)
+            print("Logfile for job '%s' written to '%s'" % (job_id, log_path))
+
+        def _download(item):
+            name, download_fcn = item
+            try:
+                download_fcn()
+                return True
+            except APIError as e:
+                print("Failed to download %s of job '%s': %s" % (
+                    name, job_id, e))
+                return False
+
+        successes = api.thread_map(_download, [
+            ("output", _download_output),
+            ("logfile", _download_logfile),
+        ], max_workers=2)
+
+        if not all(successes):
+            sys.exit(1)
+
+
 class KillJobsCommand(Command):
     '''Kill jobs on the platform.
 
@@ -1218,7 +1380,8 @@ class KillJobsCommand(Command):
     @staticmethod
     def setup(parser):
         parser.add_argument(
-            "ids", nargs="*", metavar="ID", help="job ID(s) to kill")
+            "ids", nargs="*", metavar="ID", default=[],
+            help="job ID(s) to kill")
         parser.add_argument(
             "-a", "--all", action="store_true",
             help="whether to kill all eligible (queued or scheduled) jobs")
@@ -1232,24 +1395,23 @@ class KillJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        from voxel51.users.jobs import JobState
+        from voxel51.users.query import JobsQuery
 
         if args.all:
-            query = (JobsQuery()
-                .add_all_fields()
-                .add_search("archived", False)
-                .add_search_or("state", [JobState.QUEUED, JobState.SCHEDULED])
-                .sort_by("upload_date", descending=False))
-            jobs = api.query_jobs(query)["jobs"]
-            job_ids = [job["id"] for job in jobs]
+            api = _get_api()
+            query = _make_all_query(
+                JobsQuery, archived=False,
+                state=[JobState.QUEUED, JobState.SCHEDULED])
+            job_ids = (job["id"] for job in api.iter_query_jobs(query))
         else:
             job_ids = args.ids
 
         if args.dry_run:
-            for job_id in job_ids:
-                print(job_id)
+            _print_ids(_iter_unique(job_ids))
             return
 
+        job_ids = list(_iter_unique(job_ids))
         num_jobs = len(job_ids)
 
         if args.all:
@@ -1260,7 +1422,8 @@ class KillJobsCommand(Command):
         if num_jobs == 0:
             return
 
-        response = api.batch_kill_jobs(job_ids)
+        api = _get_api()
+        response = _batch_request_in_chunks(api.batch_kill_jobs, job_ids)
 
         _log_batch_response(
             response, success_message="job(s) killed",
@@ -1281,7 +1444,8 @@ class DeleteJobsCommand(Command):
     @staticmethod
     def setup(parser):
         parser.add_argument(
-            "ids", nargs="*", metavar="ID", help="job ID(s) to delete")
+            "ids", nargs="*", metavar="ID", default=[],
+            help="job ID(s) to delete")
         parser.add_argument(
             "-a", "--all", action="store_true",
             help="whether to delete all eligible (unstarted) jobs")
@@ -1295,24 +1459,22 @@ class DeleteJobsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        from voxel51.users.jobs import JobState
+        from voxel51.users.query import JobsQuery
 
         if args.all:
-            query = (JobsQuery()
-                .add_all_fields()
-                .add_search("archived", False)
-                .add_search("state", JobState.READY)
-                .sort_by("upload_date", descending=False))
-            jobs = api.query_jobs(query)["jobs"]
-            job_ids = [job["id"] for job in jobs]
+            api = _get_api()
+            query = _make_all_query(
+                JobsQuery, archived=False, state=JobState.READY)
+            job_ids = (job["id"] for job in api.iter_query_jobs(query))
         else:
             job_ids = args.ids
 
         if args.dry_run:
-            for job_id in job_ids:
-                print(job_id)
+            _print_ids(_iter_unique(job_ids))
             return
 
+        job_ids = list(_iter_unique(job_ids))
         num_jobs = len(job_ids)
 
         if args.all:
@@ -1323,7 +1485,8 @@ class DeleteJobsCommand(Command):
         if num_jobs == 0:
             return
 
-        response = api.batch_delete_jobs(job_ids)
+        api = _get_api()
+        response = _batch_request_in_chunks(api.batch_delete_jobs, job_ids)
 
         _log_batch_response(
             response, success_message="job(s) deleted",
@@ -1336,13 +1499,14 @@ class AnalyticsCommand(Command):
     @staticmethod
     def setup(parser):
         subparsers = parser.add_subparsers(title="available commands")
-        _register_command(subparsers, "list", ListAnalyticsCommand)
-        _register_command(subparsers, "info", InfoAnalyticsCommand)
-        _register_command(subparsers, "doc", DocAnalyticsCommand)
-        _register_command(subparsers, "upload", UploadAnalyticsCommand)
-        _register_command(
-            subparsers, "upload-image", UploadImageAnalyticsCommand)
-        _register_command(subparsers, "delete", DeleteAnalyticsCommand)
+        _register_commands(subparsers, [
+            ("list", ListAnalyticsCommand),
+            ("info", InfoAnalyticsCommand),
+            ("doc", DocAnalyticsCommand),
+            ("upload", UploadAnalyticsCommand),
+            ("upload-image", UploadImageAnalyticsCommand),
+            ("delete", DeleteAnalyticsCommand),
+        ], level=1)
 
     @staticmethod
     def execute(parser, args):
@@ -1356,6 +1520,9 @@ class ListAnalyticsCommand(Command):
         Unless overridden, only the latest version of each analytic is listed,
         and pending analytics are included.
 
+        Query results are cached locally for 60 seconds, or for the number of
+        seconds in the `VOXEL51_QUERY_CACHE_TTL` environment variable.
+
     Examples:
         # List analytics according to the given query
         voxel51 analytics list \\
@@ -1417,8 +1584,9 @@ class ListAnalyticsCommand(Command):
             "-s", "--search", metavar="SEARCH",
             help="search to limit results when listing analytics")
         parser.add_argument(
-            "--sort-by", metavar="FIELD",
-            help="field to sort by when listing analytics")
+            "--sort-by", metavar="FIELD", default="upload_date",
+            help="field to sort by when listing analytics. The default is "
+            "upload_date")
         parser.add_argument(
             "--ascending", action="store_true",
             help="whether to sort in ascending order")
@@ -1431,6 +1599,13 @@ class ListAnalyticsCommand(Command):
         parser.add_argument(
             "-c", "--count", action="store_true",
             help="whether to show the number of analytics in the list")
+        parser.add_argument(
+            "--no-format", action="store_true",
+            help="whether to print tab-separated fields with no header or "
+            "alignment")
+        parser.add_argument(
+            "--no-cache", action="store_true",
+            help="whether to bypass the local cache of analytics queries")
 
         scopes = parser.add_argument_group("scope arguments")
         scopes.add_argument(
@@ -1451,17 +1626,11 @@ class ListAnalyticsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        from voxel51.users.query import AnalyticsQuery
 
-        query = AnalyticsQuery().add_all_fields()
-
-        if args.limit >= 0:
-            query = query.set_limit(args.limit)
-
-        sort_field = args.sort_by if args.sort_by else "upload_date"
-        descending = not args.ascending
-        query = query.sort_by(sort_field, descending=descending)
+        api = _get_api()
 
+        query = _make_list_query(AnalyticsQuery, args)
         query = query.set_all_versions(args.all_versions)
 
         scopes = []
@@ -1472,19 +1641,26 @@ class ListAnalyticsCommand(Command):
         if scopes:
             query = query.add_search_or("scope", scopes)
 
-        if args.search is not None:
-            query = query.add_search_direct(args.search)
-
-        if args.search is None or "pending:" not in args.search:
+        search = args.search
+        if search is None or _PENDING_SEARCH not in search:
             # default: include pending
             if args.pending_only:
                 query = query.add_search("pending", True)
             if args.exclude_pending:
                 query = query.add_search("pending", False)
 
-        analytics = api.query_analytics(query)["analytics"]
+        key = _get_cache_key(api, "analytics/query", query.to_dict())
+        analytics = None
+        if not args.no_cache:
+            analytics = _cache_get(key, ttl=_get_query_cache_ttl())
+
+        if analytics is None:
+            analytics = api.query_analytics(query)["analytics"]
+            _cache_put(key, analytics)
+
         _print_analytics_table(
-            analytics, show_count=args.count, show_all_fields=args.all_fields)
+            analytics, show_count=args.count, show_all_fields=args.all_fields,
+            no_format=args.no_format)
 
 
 class InfoAnalyticsCommand(Command):
@@ -1506,12 +1682,17 @@ class InfoAnalyticsCommand(Command):
         parser.add_argument(
             "-a", "--all-fields", action="store_true",
             help="whether to print all available fields")
+        parser.add_argument(
+            "--no-cache", action="store_true",
+            help="whether to bypass the local cache of analytic details")
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
-        response = api.batch_get_analytic_details(args.ids)
+        response = _get_cached_batch_response(
+            api, "analytics", args.ids, api.batch_get_analytic_details,
+            use_cache=not args.no_cache)
 
         _log_batch_response(
             response, success_message=None,
@@ -1537,12 +1718,21 @@ class DocAnalyticsCommand(Command):
         parser.add_argument("id", metavar="ID", help="the analytic ID")
         parser.add_argument(
             "-p", "--path", metavar="PATH", help="path to write doc JSON")
+        parser.add_argument(
+            "--no-cache", action="store_true",
+            help="whether to bypass the local cache of analytic docs")
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        import voxel51.users.utils as voxu
+
+        api = _get_api()
 
-        doc = api.get_analytic_doc(args.id)
+        key = _get_cache_key(api, "analytics/doc", args.id)
+        doc = _cache_get(key) if not args.no_cache else None
+        if doc is None:
+            doc = api.get_analytic_doc(args.id)
+            _cache_put(key, doc)
 
         if args.path:
             voxu.write_json(doc, args.path)
@@ -1574,10 +1764,11 @@ class UploadAnalyticsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
         metadata = api.upload_analytic(
             args.doc, analytic_type=args.analytic_type)
+        _cache_clear()
 
         if args.print_id:
             print(metadata["id"])
@@ -1608,9 +1799,10 @@ class UploadImageAnalyticsCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
         api.upload_analytic_image(args.id, args.path, args.image_type)
+        _cache_clear()
         print(
             "%s image for analytic %s uploaded" %
             (args.image_type.upper(), args.id))
@@ -1632,21 +1824,30 @@ class DeleteAnalyticsCommand(Command):
         parser.add_argument(
             "-f", "--force", action="store_true",
             help="whether to force delete without confirmation")
+        parser.add_argument(
+            "--num-workers", metavar="N", type=int, default=16,
+            help="the number of analytics to delete in parallel. The default "
+            "is 16")
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
-        analytic_ids = args.ids
+        analytic_ids = list(_iter_unique(args.ids))
 
         num_analytics = len(analytic_ids)
         print("Found %d analytic(s) to delete" % num_analytics)
         if num_analytics > 0 and not args.force:
             _abort_if_requested()
 
-        for analytic_id in analytic_ids:
-            api.delete_analytic(analytic_id)
-            print("Analytic '%s' deleted" % analytic_id)
+        num_workers = max(1, min(args.num_workers, num_analytics))
+        response = api.batch_delete_analytics(
+            analytic_ids, max_workers=num_workers)
+        _cache_clear()
+
+        _log_batch_response(
+            response, success_message="analytic(s) deleted",
+            failure_message="failed to delete analytic")
 
 
 class StatusCommand(Command):
@@ -1674,7 +1875,7 @@ class StatusCommand(Command):
 
     @staticmethod
     def execute(parser, args):
-        api = API()
+        api = _get_api()
 
         status = api.get_platform_status()
 
@@ -1688,19 +1889,188 @@ class StatusCommand(Command):
             _print_platform_status_info(status)
 
 
+class CacheCommand(Command):
+    '''Tools for managing the local cache of API responses.
+
+    Examples:
+        # Clear the cache
+        voxel51 cache --clean
+    '''
+
+    @staticmethod
+    def setup(parser):
+        parser.add_argument(
+            "--clean", action="store_true",
+            help="whether to delete all cached API responses")
+
+    @staticmethod
+    def execute(parser, args):
+        if not args.clean:
+            parser.print_help()
+            return
+
+        _cache_clear()
+        print("Cache cleared")
+
+
+def _get_api():
+    # Constructs the API client on first use and reuses it until the active
+    # token changes
+    global _api
+    import voxel51.users.auth as voxa
+
+    token_path = voxa.get_active_token_path()
+    if token_path is not None:
+        key = (token_path, os.path.getmtime(token_path))
+    else:
+        key = None
+
+    if _api is None or _api[0] != key:
+        from voxel51.users.api import API
+        _api = (key, API(keep_alive=True))
+
+    return _api[1]
+
+
+def _make_list_query(query_cls, args):
+    # Builds the query options shared by the `list` commands
+    query = query_cls().add_all_fields()
+
+    if args.limit >= 0:
+        query = query.set_limit(args.limit)
+
+    query = query.sort_by(args.sort_by, descending=not args.ascending)
+
+    if args.search is not None:
+        query = query.add_search_direct(args.search)
+
+    return query
+
+
+def _make_all_query(query_cls, **search):
+    # Builds a query for the IDs of all records with the given field values,
+    # oldest first. List values match any of the given values
+    query = query_cls().add_field("id")
+    for field, value in sorted(search.items()):
+        if isinstance(value, list):
+            query.add_search_or(field, value)
+        else:
+            query.add_search(field, value)
+
+    return query.sort_by("upload_date", descending=False)
+
+
+def _batch_request_in_chunks(batch_fcn, ids, **kwargs):
+    # Applies the batch function to chunks of the given IDs in parallel and
+    # merges the responses, so that large batches do not go out as a single
+    # giant request. If a chunk fails outright, its IDs are reported as
+    # failures rather than discarding the chunks that were already applied
+    from voxel51.users.api import API, APIError
+
+    chunks = [
+        ids[i:i + _BATCH_CHUNK_SIZE]
+        for i in range(0, len(ids), _BATCH_CHUNK_SIZE)]
+    if len(chunks) <= 1:
+        return batch_fcn(ids, **kwargs)
+
+    def _request_chunk(chunk):
+        try:
+            return batch_fcn(chunk, **kwargs)
+        except APIError as e:
+            failure = {"success": False, "error": {"message": str(e)}}
+            return {_id: failure for _id in chunk}
+
+    responses = API.thread_map(
+        _request_chunk, chunks,
+        max_workers=min(_BATCH_MAX_WORKERS, len(chunks)))
+
+    response = {}
+    for chunk_response in responses:
+        response.update(chunk_response)
+
+    return response
+
+
+def _get_cached_batch_response(api, type, ids, batch_fcn, use_cache=True):
+    # Returns a batch response for the given IDs, fetching only the IDs whose
+    # responses are not already cached
+    response = {}
+    missing_ids = []
+    for _id in ids:
+        value = None
+        if use_cache:
+            value = _cache_get(_get_cache_key(api, type, _id))
+
+        if value is not None:
+            response[_id] = {"success": True, "response": value}
+        else:
+            missing_ids.append(_id)
+
+    if missing_ids:
+        for _id, status in batch_fcn(missing_ids).items():
+            if status["success"]:
+                _cache_put(_get_cache_key(api, type, _id), status["response"])
+
+            response[_id] = status
+
+    return {_id: response[_id] for _id in ids if _id in response}
+
+
+def _get_cache_key(api, *args):
+    # Keys include the token so that responses are never shared across users
+    key_str = json.dumps([api.base_url, api.token.private_key] + list(args))
+    return hashlib.sha256(key_str.encode("utf-8")).hexdigest()
+
+
+def _get_query_cache_ttl():
+    try:
+        return int(os.environ[_QUERY_CACHE_TTL_ENV_VAR])
+    except (KeyError, ValueError):
+        return _QUERY_CACHE_TTL
+
+
+def _cache_get(key, ttl=_CACHE_TTL):
+    path = os.path.join(_CACHE_DIR, key + ".json")
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+
+        with open(path, "r") as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def _cache_put(key, value):
+    path = os.path.join(_CACHE_DIR, key + ".json")
+    try:
+        if not os.path.isdir(_CACHE_DIR):
+            os.makedirs(_CACHE_DIR)
+
+        with open(path, "w") as f:
+            json.dump(value, f)
+    except (IOError, OSError):
+        pass
+
+
+def _cache_clear():
+    shutil.rmtree(_CACHE_DIR, ignore_errors=True)
+
+
 def _print_platform_status_info(status):
     records = []
-    for service, status_item in iteritems(status):
+    for service, status_item in status.items():
         records.append(
             (service, status_item["operational"], status_item["message"]))
 
-    table_str = tabulate(
-        records, headers=["service", "operational", "message"],
-        tablefmt=_TABLE_FORMAT)
+    table_str = _render_table(
+        records, headers=["service", "operational", "message"])
     print(table_str)
 
 
 def _print_active_token_info():
+    import voxel51.users.auth as voxa
+
     token_path = voxa.get_active_token_path()
     token = voxa.load_token(token_path=token_path)
     contents = [
@@ -1710,45 +2080,47 @@ def _print_active_token_info():
         ("base api url", token.base_api_url),
         ("path", token_path),
     ]
-    table_str = tabulate(
-        contents, headers=["API token", ""], tablefmt=_TABLE_FORMAT)
+    table_str = _render_table(
+        contents, headers=["API token", ""])
     print(table_str)
 
 
-def _print_data_table(data, show_count=False, show_all_fields=False):
+def _print_data_table(
+        data, show_count=False, show_all_fields=False, no_format=False):
+    from voxel51.users.query import DataQuery
+
     if show_count:
         total_size = _render_bytes(sum(d["size"] for d in data))
 
     render_fcns = {
-        "name": _render_long_str,
         "size": _render_bytes,
         "upload_date": _render_datetime,
         "expiration_date": _render_datetime,
     }
-    _render_fields(data, render_fcns)
+    if not no_format:
+        render_fcns["name"] = _render_long_str
 
     if show_all_fields:
         fields = DataQuery.SUPPORTED_FIELDS
     else:
-        fields = [
-            "id", "name", "size", "type", "upload_date", "expiration_date"]
+        fields = _DATA_TABLE_FIELDS
 
-    records = _render_records(data, fields)
-    table_str = tabulate(records, headers=fields, tablefmt=_TABLE_FORMAT)
-
-    print(table_str)
+    records = _build_records(data, fields, render_fcns)
+    _print_records(records, fields, no_format=no_format)
     if show_count:
         print("\nShowing %d data, %s\n" % (len(data), total_size))
 
 
 def _print_data_uploads(uploads):
-    table_str = tabulate(uploads, headers="keys", tablefmt=_TABLE_FORMAT)
+    table_str = _render_table(uploads, headers="keys")
     print("\n" + table_str + "\n")
 
 
-def _print_jobs_table(jobs, show_count=False, show_all_fields=False):
+def _print_jobs_table(
+        jobs, show_count=False, show_all_fields=False, no_format=False):
+    from voxel51.users.query import JobsQuery
+
     render_fcns = {
-        "name": _render_long_str,
         "upload_date": _render_datetime,
         "expiration_date": _render_datetime,
         "start_date": _render_datetime,
@@ -1756,44 +2128,40 @@ def _print_jobs_table(jobs, show_count=False, show_all_fields=False):
         "auto_start": bool,
         "expired": bool,
     }
-    _render_fields(jobs, render_fcns)
+    if not no_format:
+        render_fcns["name"] = _render_long_str
 
     if show_all_fields:
         fields = JobsQuery.SUPPORTED_FIELDS
     else:
-        fields = [
-            "id", "name", "state", "archived", "upload_date",
-            "expiration_date", "expired"]
+        fields = _JOBS_TABLE_FIELDS
 
-    records = _render_records(jobs, fields)
-    table_str = tabulate(records, headers=fields, tablefmt=_TABLE_FORMAT)
-
-    print(table_str)
+    records = _build_records(jobs, fields, render_fcns)
+    _print_records(records, fields, no_format=no_format)
     if show_count:
         print("\nShowing %d job(s)\n" % len(jobs))
 
 
-def _print_analytics_table(analytics, show_count=False, show_all_fields=False):
+def _print_analytics_table(
+        analytics, show_count=False, show_all_fields=False, no_format=False):
+    from voxel51.users.query import AnalyticsQuery
+
     render_fcns = {
         "supports_cpu": bool,
         "supports_gpu": bool,
         "pending": bool,
         "upload_date": _render_datetime,
-        "description": _render_long_str,
     }
-    _render_fields(analytics, render_fcns)
+    if not no_format:
+        render_fcns["description"] = _render_long_str
 
     if show_all_fields:
         fields = AnalyticsQuery.SUPPORTED_FIELDS
     else:
-        fields = [
-            "id", "name", "version", "scope", "supports_cpu", "supports_gpu",
-            "pending", "upload_date"]
-
-    records = _render_records(analytics, fields)
-    table_str = tabulate(records, headers=fields, tablefmt=_TABLE_FORMAT)
+        fields = _ANALYTICS_TABLE_FIELDS
 
-    print(table_str)
+    records = _build_records(analytics, fields, render_fcns)
+    _print_records(records, fields, no_format=no_format)
     if show_count:
         print("\nFound %d analytic(s)\n" % len(analytics))
 
@@ -1812,23 +2180,129 @@ def _print_upload_analytic_info(metadata):
         "is_image_to_video", "description"]
     contents = [(f, metadata[f]) for f in fields]
 
-    table_str = tabulate(
-        contents, headers=["Analytic", ""], tablefmt=_TABLE_FORMAT)
+    table_str = _render_table(
+        contents, headers=["Analytic", ""])
     print(table_str)
 
 
+def _print_records(records, fields, no_format=False):
+    if no_format:
+        # Tab-separated values, with no header or alignment
+        lines = (
+            "\t".join(_render_cell(v) for v in record) for record in records)
+    else:
+        lines = _render_table_lines(records, headers=fields)
+
+    _print_lines(lines)
+
+
+def _print_lines(lines):
+    # Writes the lines in chunks, so that large tables are never built into a
+    # single string
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= _PRINT_CHUNK_SIZE:
+            sys.stdout.write("\n".join(chunk) + "\n")
+            chunk = []
+
+    if chunk:
+        sys.stdout.write("\n".join(chunk) + "\n")
+
+
+def _render_table(rows, headers):
+    return "\n".join(_render_table_lines(rows, headers))
+
+
+def _render_table_lines(rows, headers):
+    # Renders the rows as plain-text table lines with a dashed header
+    # underline; numeric columns, including strings that parse as numbers,
+    # are right-aligned and all others are left-aligned
+    if headers == "keys":
+        headers = []
+        for row in rows:
+            headers.extend(k for k in row if k not in headers)
+        rows = [tuple(row.get(k, None) for k in headers) for row in rows]
+
+    # Render cells, column widths, and column types in a single pass
+    widths = [len(h) + 2 for h in headers]
+    is_numeric = [None] * len(headers)  # None until a column has a value
+    cells = []
+    for row in rows:
+        row_cells = []
+        for i, v in enumerate(row):
+            cell = _render_cell(v)
+            if v is not None:
+                is_num = _is_number(v)
+                is_numeric[i] = is_num and is_numeric[i] is not False
+                if len(cell) > widths[i]:
+                    widths[i] = len(cell)
+
+            row_cells.append(cell)
+
+        cells.append(row_cells)
+
+    # Format every line with a single precomputed format string
+    fmt = "  ".join(
+        ("%%%ds" if r else "%%-%ds") % w for w, r in zip(widths, is_numeric))
+    yield (fmt % tuple(headers)).rstrip()
+    yield (fmt % tuple("-" * w for w in widths)).rstrip()
+    for row_cells in cells:
+        yield (fmt % tuple(row_cells)).rstrip()
+
+
+def _is_number(value):
+    # Like `tabulate`, strings such as "1.0" count as numbers
+    if isinstance(value, bool):
+        return False
+    try:
+        float(value)
+        return True
+    except (TypeError, ValueError):
+        return False
+
+
+def _render_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return format(value, "g")
+    return str(value)
+
+
+def _iter_unique(ids):
+    # Yields the IDs in order, skipping any repeats, so that batch requests
+    # never process the same record twice
+    seen = set()
+    for _id in ids:
+        if _id not in seen:
+            seen.add(_id)
+            yield _id
+
+
+def _print_ids(ids):
+    # Prints one ID per line as the IDs arrive, so that IDs streamed from
+    # paginated queries are never all held in memory
+    _print_lines(ids)
+
+
 def _print_dict_as_json(d):
-    s = json.dumps(d, indent=4)
-    print(s)
+    # Stream directly to stdout rather than building the full string. The
+    # standard `json` module is always used, so that the output does not
+    # depend on which optional packages are installed
+    json.dump(d, sys.stdout, indent=4)
+    sys.stdout.write("\n")
 
 
 def _render_long_str(name):
     if len(name) > _MAX_NAME_COLUMN_WIDTH:
-        name = name[:(_MAX_NAME_COLUMN_WIDTH - 4)] + " ..."
+        name = name[:_TRUNCATED_NAME_WIDTH] + _ELLIPSIS
     return name
 
 
 def _render_bytes(size):
+    import voxel51.users.utils as voxu
+
     if size is None or size < 0:
         return ""
     return voxu.to_human_bytes_str(size)
@@ -1838,21 +2312,85 @@ def _render_datetime(datetime_str):
     if not datetime_str:
         return ""
 
-    dt = dateutil.parser.isoparse(datetime_str)
-    return dt.astimezone(get_localzone()).strftime("%Y-%m-%d %H:%M:%S %Z")
+    # Dates often repeat within a table, e.g., the expiration dates of records
+    # whose TTLs were set together
+    rendered = _rendered_datetimes.get(datetime_str, None)
+    if rendered is None:
+        dt = _parse_datetime(datetime_str)
+        rendered = dt.astimezone(_get_local_timezone()).strftime(
+            _DATETIME_FORMAT)
+        if len(_rendered_datetimes) < _MAX_RENDERED_DATETIMES:
+            _rendered_datetimes[datetime_str] = rendered
+
+    return rendered
+
+
+def _parse_datetime(datetime_str):
+    # `datetime.fromisoformat()` is much faster than `dateutil`, but it is not
+    # available in Python 2 and it rejects some ISO 8601 strings before Python
+    # 3.11, so `dateutil` remains the fallback
+    if _fromisoformat is not None:
+        if datetime_str.endswith("Z"):
+            datetime_str = datetime_str[:-1] + "+00:00"
+        try:
+            return _fromisoformat(datetime_str)
+        except ValueError:
+            pass
+
+    import dateutil.parser
+    return dateutil.parser.isoparse(datetime_str)
+
+
+def _get_local_timezone():
+    # Looked up once per process, since it is needed for every rendered date
+    global _local_timezone
+
+    if _local_timezone is None:
+        from tzlocal import get_localzone
+        _local_timezone = get_localzone()
+
+    return _local_timezone
 
 
 def _render_fields(d, render_fcns):
+    # Visits only the fields that have render functions, rather than every
+    # field of every record
+    render_fcns = list(render_fcns.items())
     for di in d:
-        for ki, vi in iteritems(di):
-            if ki in render_fcns:
-                di[ki] = render_fcns[ki](vi)
+        for ki, render_fcn in render_fcns:
+            if ki in di:
+                di[ki] = render_fcn(di[ki])
+
+
+def _build_records(d, fields, render_fcns):
+    # Extracts the given fields of each record as a row and renders them, in
+    # a single pass over the records
+    renders = [
+        (i, field, render_fcns[field]) for i, field in enumerate(fields)
+        if field in render_fcns]
 
+    # Look up all fields in one C-level call, falling back to `get()` for the
+    # rare records that lack some of the fields
+    get_fields = operator.itemgetter(*fields)
+    is_single_field = len(fields) == 1
 
-def _render_records(d, fields):
     records = []
     for di in d:
-        records.append(tuple(di.get(f, "") for f in fields))
+        try:
+            record = get_fields(di)
+            if is_single_field:
+                record = (record,)
+        except KeyError:
+            record = tuple(di.get(f, "") for f in fields)
+
+        if renders:
+            record = list(record)
+            for i, field, render_fcn in renders:
+                if field in di:
+                    record[i] = render_fcn(record[i])
+
+        records.append(record)
+
     return records
 
 
@@ -1865,26 +2403,33 @@ def _log_batch_response(
     num_failures = len(failures)
     num_successes = num_items - num_failures
 
-    if num_failures > 0:
-        for xid, message in iteritems(failures):
-            print("%s '%s': %s" % (failure_message.capitalize(), xid, message))
+    # Report all failures with a few large writes rather than one per item
+    failure_message = failure_message.capitalize()
+    lines = [
+        "%s '%s': %s" % (failure_message, xid, message)
+        for xid, message in failures.items()]
 
     if success_message:
-        print("%d/%d %s" % (num_successes, num_items, success_message))
+        lines.append(
+            "%d/%d %s" % (num_successes, num_items, success_message))
+
+    _print_lines(lines)
 
 
 def _get_batch_responses(response):
-    return [r["response"] for r in itervalues(response) if r["success"]]
+    return [r["response"] for r in response.values() if r["success"]]
 
 
 def _get_batch_failures(response):
     return {
         id: status.get("error", {}).get("message", "????")
-        for id, status in iteritems(response) if not status["success"]
+        for id, status in response.items() if not status["success"]
     }
 
 
 def _abort_if_requested():
+    import voxel51.users.utils as voxu
+
     should_continue = voxu.query_yes_no(
         "Are you sure you want to continue?", default="no")
 
@@ -1903,7 +2448,7 @@ def _has_subparsers(parser):
 def _iter_subparsers(parser):
     for action in parser._actions:
         if isinstance(action, argparse._SubParsersAction):
-            for subparser in itervalues(action.choices):
+            for subparser in action.choices.values():
                 yield subparser
 
 
@@ -1920,8 +2465,67 @@ class _RecursiveHelpAction(argparse._HelpAction):
             _RecursiveHelpAction._recurse(subparser)
 
 
+def _prefetch_imports():
+    if "_ARGCOMPLETE" in os.environ:
+        return
+
+    if any(arg in ("-h", "--help", "--all-help") for arg in sys.argv[1:]):
+        return
+
+    command = _sniff_command(list(_PREFETCH_MODULES))
+    if command is None:
+        return
+
+    thread = threading.Thread(
+        target=_import_quietly, args=(_PREFETCH_MODULES[command],))
+    thread.daemon = True
+    thread.start()
+
+
+def _import_quietly(name):
+    try:
+        importlib.import_module(name)
+    except Exception:
+        pass  # the command itself will surface any import errors
+
+
+def _register_commands(parent, commands, level):
+    # Only builds the parser for the command being invoked, if any
+    active = _sniff_command([name for name, _ in commands], level=level)
+    for name, command in commands:
+        if active is None or name == active:
+            _register_command(parent, name, command)
+
+
+def _sniff_command(names, level=0):
+    # Returns the command in `names` being invoked at the given level of the
+    # command hierarchy, or None if the command line does not name one (e.g.,
+    # `voxel51 --help`)
+    if "_ARGCOMPLETE" in os.environ:
+        # Only consider the words completed before the cursor, since a
+        # partial word (e.g., `upload`) may prefix other commands
+        line = os.environ.get("COMP_LINE", "")
+        line = line[:int(os.environ.get("COMP_POINT", len(line)))]
+        argv = line.split()[1:]
+        if argv and not line[-1:].isspace():
+            argv = argv[:-1]
+    else:
+        argv = sys.argv[1:]
+
+    positionals = [arg for arg in argv if not arg.startswith("-")]
+    if len(positionals) > level and positionals[level] in names:
+        return positionals[level]
+
+    return None
+
+
 def _register_main_command(command, version=None, recursive_help=True):
-    parser = argparse.ArgumentParser(description=command.__doc__.rstrip())
+    # Only needed once the parser exists, e.g., not for `voxel51 --version`
+    import argcomplete
+
+    # Docstrings are stripped when running under `python -OO`
+    doc = command.__doc__ or ""
+    parser = argparse.ArgumentParser(description=doc.rstrip())
 
     parser.set_defaults(execute=lambda args: command.execute(parser, args))
     command.setup(parser)
@@ -1941,9 +2545,10 @@ def _register_main_command(command, version=None, recursive_help=True):
 
 
 def _register_command(parent, name, command, recursive_help=True):
+    # Docstrings are stripped when running under `python -OO`
+    doc = command.__doc__ or ""
     parser = parent.add_parser(
-        name, help=command.__doc__.splitlines()[0],
-        description=command.__doc__.rstrip(),
+        name, help=doc.partition("\n")[0], description=doc.rstrip(),
         formatter_class=argparse.RawTextHelpFormatter)
 
     parser.set_defaults(execute=lambda args: command.execute(parser, args))
@@ -1959,6 +2564,14 @@ def _register_command(parent, name, command, recursive_help=True):
 
 def main():
     '''Executes the `voxel51` tool with the given command-line args.'''
+    # Fast path: no need to build the parser just to print the version
+    if sys.argv[1:] in (["-v"], ["--version"]):
+        print(voxc.VERSION_LONG)
+        return
+
+    # Import the modules the command will need while the parser is built
+    _prefetch_imports()
+
     parser = _register_main_command(Voxel51Command, version=voxc.VERSION_LONG)
     args = parser.parse_args()
     args.execute(args)
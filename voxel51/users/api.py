@@ -18,6 +18,7 @@ from builtins import *
 # pragma pylint: enable=wildcard-import
 
 from concurrent.futures import ThreadPoolExecutor
+import copy
 from datetime import datetime
 import os
 import time
@@ -33,6 +34,8 @@ import voxel51.users.utils as voxu
 
 
 _CHUNK_SIZE = 32 * 1024 * 1024  # in bytes
+_QUERY_PAGE_SIZE = 1000  # in records
+_POOL_SIZE = 16  # max connections kept alive per host by sessions
 
 
 class AnalyticType(object):
@@ -88,7 +91,7 @@ class API(object):
         self.token = token
         self.keep_alive = keep_alive
         self._header = token.get_header()
-        self._requests = requests.Session() if keep_alive else requests
+        self._requests = _make_session() if keep_alive else requests
 
     def __enter__(self):
         return self
@@ -349,6 +352,35 @@ class API(object):
         '''
         return self._batch_request("analytics", "details", analytic_ids)
 
+    def batch_delete_analytics(self, analytic_ids, max_workers=None):
+        '''Deletes the analytics with the given IDs. Only analytics that you
+        own can be deleted.
+
+        The platform has no batch endpoint for deleting analytics, so the
+        analytics are deleted via parallel requests using :func:`thread_map`.
+
+        Args:
+            analytic_ids (list): the analytic IDs
+            max_workers (int, optional): the number of worker threads to use.
+                See :func:`thread_map` for details
+
+        Returns:
+            a dictionary mapping analytic IDs to dictionaries indicating
+            whether the analytic was successfully deleted. The ``success``
+            field will be set to ``True`` on success or ``False`` on failure
+        '''
+        def _delete_analytic(analytic_id):
+            try:
+                self.delete_analytic(analytic_id)
+                return {"success": True}
+            except APIError as e:
+                return {"success": False, "error": {"message": str(e)}}
+
+        analytic_ids = list(analytic_ids)
+        statuses = self.thread_map(
+            _delete_analytic, analytic_ids, max_workers=max_workers)
+        return dict(zip(analytic_ids, statuses))
+
     # DATA ####################################################################
 
     def list_data(self):
@@ -385,6 +417,29 @@ class API(object):
         _validate_response(res)
         return _parse_json_response(res)
 
+    def iter_query_data(self, data_query, page_size=_QUERY_PAGE_SIZE):
+        '''Performs a customized data query, fetching the results in pages.
+
+        Pages are requested as the returned iterator is consumed, with the
+        next page fetched in the background while the current one is
+        processed, so at most two pages of results are held in memory at a
+        time. Any offset or limit set on the query is respected. The query
+        itself is not modified.
+
+        Args:
+            data_query (voxel51.users.query.DataQuery): a DataQuery instance
+                defining the customized data query to perform
+            page_size (int, optional): the number of records to request per
+                page. By default, this is 1000
+
+        Returns:
+            an iterator over dictionaries describing the data
+
+        Raises:
+            :class:`APIError` if a request was unsuccessful
+        '''
+        return self._iter_query(self.query_data, data_query, "data", page_size)
+
     def upload_data(self, path, ttl=None):
         '''Uploads the given data.
 
@@ -672,6 +727,29 @@ class API(object):
         _validate_response(res)
         return _parse_json_response(res)
 
+    def iter_query_jobs(self, jobs_query, page_size=_QUERY_PAGE_SIZE):
+        '''Performs a customized jobs query, fetching the results in pages.
+
+        Pages are requested as the returned iterator is consumed, with the
+        next page fetched in the background while the current one is
+        processed, so at most two pages of results are held in memory at a
+        time. Any offset or limit set on the query is respected. The query
+        itself is not modified.
+
+        Args:
+            jobs_query (voxel51.users.query.JobsQuery): a JobsQuery instance
+                defining the customized jobs query to perform
+            page_size (int, optional): the number of records to request per
+                page. By default, this is 1000
+
+        Returns:
+            an iterator over dictionaries describing the jobs
+
+        Raises:
+            :class:`APIError` if a request was unsuccessful
+        '''
+        return self._iter_query(self.query_jobs, jobs_query, "jobs", page_size)
+
     def upload_job_request(
             self, job_request, job_name, auto_start=False, ttl=None):
         '''Uploads a job request.
@@ -909,7 +987,7 @@ class API(object):
         # Note that we could just return `job.expired` here, but we are
         # computing this value dynamically from `job.expiration_date` in case
         # the job metadata was generated awhile ago...
-        expiration = dateutil.parser.parse(job["expiration_date"])
+        expiration = _parse_iso_datetime(job["expiration_date"])
         now = datetime.utcnow()
         return now >= expiration.replace(tzinfo=None)
 
@@ -930,7 +1008,7 @@ class API(object):
         _validate_response(res)
         return _parse_json_response(res)
 
-    def download_job_output(self, job_id, output_path=None):
+    def download_job_output(self, job_id, output_path=None, num_streams=1):
         '''Downloads the output of the job with the given ID.
 
         Args:
@@ -938,6 +1016,11 @@ class API(object):
             output_path (str, optional): the output path to write to. By
                 default, the file is written to the current working directory
                 with the recommend output filename for the job
+            num_streams (int, optional): the number of parallel HTTP range
+                requests to use to download the output. By default, the output
+                is downloaded in a single stream. At most 16 streams are used.
+                Outputs whose storage does not support range requests are
+                always downloaded in one stream
 
         Returns:
             the path to the downloaded job output
@@ -948,6 +1031,11 @@ class API(object):
         if not output_path:
             output_path = self.get_job_details(job_id)["output_filename"]
 
+        if num_streams > 1:
+            url = self.get_job_output_download_url(job_id)
+            if self._parallel_download(url, output_path, num_streams):
+                return output_path
+
         endpoint = voxu.urljoin(self.base_url, "jobs", job_id, "output")
         self._stream_download(endpoint, output_path)
         return output_path
@@ -1215,6 +1303,47 @@ class API(object):
         statuses = _parse_json_response(res)["responses"]
         return statuses
 
+    @staticmethod
+    def _iter_query(query_fcn, query, results_key, page_size):
+        def _fetch_page(offset, limit):
+            page_query = copy.copy(query)
+            page_query.offset = offset
+            page_query.limit = limit
+            return query_fcn(page_query)[results_key]
+
+        def _next_limit(remaining):
+            if remaining is None:
+                return page_size
+            return min(page_size, remaining)
+
+        offset = query.offset or 0
+        remaining = query.limit
+        if remaining is not None and remaining <= 0:
+            return
+
+        # Fetch the next page in the background while the current page is
+        # being consumed
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            limit = _next_limit(remaining)
+            future = executor.submit(_fetch_page, offset, limit)
+            while future is not None:
+                records = future.result()
+
+                offset += len(records)
+                if remaining is not None:
+                    remaining -= len(records)
+
+                # A short page does not mean the results are exhausted, since
+                # the server may cap the page size below the requested limit
+                if not records or remaining == 0:
+                    future = None
+                else:
+                    limit = _next_limit(remaining)
+                    future = executor.submit(_fetch_page, offset, limit)
+
+                for record in records:
+                    yield record
+
     def _stream_download(self, url, output_path):
         voxu.ensure_basedir(output_path)
         with self._requests.get(url, headers=self._header, stream=True) as res:
@@ -1223,6 +1352,68 @@ class API(object):
                 for chunk in res.iter_content(chunk_size=_CHUNK_SIZE):
                     f.write(chunk)
 
+    def _parallel_download(self, url, output_path, num_streams):
+        # Downloads the signed URL via parallel range requests. Returns False,
+        # without writing anything, if the URL does not support them
+        size = self._get_range_download_size(url)
+        if not size:
+            return False
+
+        # More streams than pooled connections would just discard connections
+        num_streams = min(num_streams, _POOL_SIZE)
+        step = -(-size // num_streams)  # ceil
+        ranges = [
+            (start, min(start + step, size) - 1)
+            for start in range(0, size, step)]
+
+        # Write to a temporary path, so that a failed range never leaves a
+        # full-size file behind that looks like a finished download
+        tmp_path = output_path + ".part"
+        voxu.ensure_basedir(tmp_path)
+        with open(tmp_path, "wb") as f:
+            f.truncate(size)
+
+        def _download_range(byte_range):
+            start, end = byte_range
+            headers = {"Range": "bytes=%d-%d" % (start, end)}
+            with self._requests.get(url, headers=headers, stream=True) as res:
+                _validate_response(res)
+                if res.status_code != 206:
+                    raise APIError(
+                        "Range request ignored for URL: %s" % url,
+                        res.status_code)
+
+                with open(tmp_path, "r+b") as f:
+                    f.seek(start)
+                    for chunk in res.iter_content(chunk_size=_CHUNK_SIZE):
+                        f.write(chunk)
+
+        try:
+            self.thread_map(_download_range, ranges, max_workers=num_streams)
+            if os.path.exists(output_path):
+                os.remove(output_path)  # `os.rename` won't replace on Windows
+
+            os.rename(tmp_path, output_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        return True
+
+    def _get_range_download_size(self, url):
+        # Probes with a one-byte range request rather than a HEAD request,
+        # since signed URLs are typically only valid for GET requests
+        headers = {"Range": "bytes=0-0"}
+        with self._requests.get(url, headers=headers, stream=True) as res:
+            content_range = res.headers.get("Content-Range", "")
+            if res.status_code != 206 or "/" not in content_range:
+                return None
+
+        try:
+            return int(content_range.rpartition("/")[2])
+        except ValueError:
+            return None  # unknown size, e.g. "bytes 0-0/*"
+
 
 class APIError(Exception):
     '''Exception raised when an :class:`API` request fails.'''
@@ -1264,6 +1455,15 @@ def _render_pretty_analytic_name(name, version=None):
     return "%s v%s" % (name, version) if version else name
 
 
+def _parse_iso_datetime(datetime_str):
+    # The API returns ISO 8601 strings, which `isoparse` handles much faster
+    # than the general-purpose parser
+    try:
+        return dateutil.parser.isoparse(datetime_str)
+    except ValueError:
+        return dateutil.parser.parse(datetime_str)
+
+
 def _parse_datetime(datetime_or_str):
     if isinstance(datetime_or_str, datetime):
         return datetime_or_str.isoformat()
@@ -1282,3 +1482,13 @@ def _validate_response(res):
 
 def _parse_json_response(res):
     return voxu.load_json(res.content)
+
+
+def _make_session():
+    # Sessions keep enough connections alive for the parallel requests made
+    # by `API.thread_map()` to reuse them
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_maxsize=_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
@@ -19,6 +19,11 @@ from builtins import *
 
 import logging
 import os
+import stat
+import sys
+import threading
+
+import six
 
 import voxel51.users.utils as voxu
 
@@ -30,12 +35,22 @@ TOKEN_ENV_VAR = "VOXEL51_API_TOKEN"
 PRIVATE_KEY_ENV_VAR = "VOXEL51_API_PRIVATE_KEY"
 BASE_API_URL_ENV_VAR = "VOXEL51_API_BASE_URL"
 
+AUTH_HEADER = "Authorization"
+if six.PY3:
+    # Header keys are inserted into a dict on every request
+    AUTH_HEADER = sys.intern(AUTH_HEADER)
+
 TOKEN_PATH = os.path.join(
     os.path.expanduser("~"), ".voxel51", "api-token.json")
 
 DEFAULT_BASE_API_URL = "https://api.voxel51.com"
 HELP_URL = "https://voxel51.com/docs/api/?python#authentication"
 
+# The most recently loaded token file, as a `((path, mtime, size), token)`
+# tuple, so that repeated `API()` constructions need not re-read it
+_cached_token = None
+_cached_token_lock = threading.Lock()
+
 
 def activate_token(path):
     '''Activates the token by copying it to ``~/.voxel51/api-token.json``.
@@ -47,6 +62,7 @@ def activate_token(path):
         path (str): the path to a :class:`Token` JSON file
     '''
     voxu.copy_file(path, TOKEN_PATH)
+    _clear_cached_token()
     logger.info("API token successfully activated")
 
 
@@ -55,6 +71,7 @@ def deactivate_token():
 
     The active token is the token at ``~/.voxel51/api-token.json``.
     '''
+    _clear_cached_token()
     try:
         os.remove(TOKEN_PATH)
         logger.info("API token '%s' successfully deactivated", TOKEN_PATH)
@@ -75,19 +92,9 @@ def get_active_token_path():
     Returns:
         the path to the active token, or None if no token was found
     '''
-    private_key = os.environ.get(PRIVATE_KEY_ENV_VAR, None)
-    if private_key:
-        return None
-
-    token_path = os.environ.get(TOKEN_ENV_VAR, None)
-    if token_path is not None:
-        if not os.path.isfile(token_path):
-            raise TokenError(
-                "No file found at '%s=%s'" % (TOKEN_ENV_VAR, token_path))
-    elif os.path.isfile(TOKEN_PATH):
-        token_path = TOKEN_PATH
-
-    return token_path
+    env = os.environ
+    return _get_active_token_path(
+        env.get(PRIVATE_KEY_ENV_VAR, None), env.get(TOKEN_ENV_VAR, None))
 
 
 def load_token(token_path=None):
@@ -118,27 +125,85 @@ def load_token(token_path=None):
         return _load_token_from_path(token_path)
 
     # Load token from environment variables, if possible
-    private_key = os.environ.get(PRIVATE_KEY_ENV_VAR, None)
+    env = os.environ
+    private_key = env.get(PRIVATE_KEY_ENV_VAR, None)
     if private_key:
-        base_api_url = os.environ.get(BASE_API_URL_ENV_VAR, None)
+        base_api_url = env.get(BASE_API_URL_ENV_VAR, None)
         return Token.from_private_key(private_key, base_api_url=base_api_url)
 
-    # Try to load token from path
-    token_path = get_active_token_path()
+    # Try to load token from `VOXEL51_API_TOKEN`
+    token_path = env.get(TOKEN_ENV_VAR, None)
     if token_path is not None:
-        return _load_token_from_path(token_path)
+        token = _read_token(token_path)
+        if token is None:
+            raise TokenError(
+                "No file found at '%s=%s'" % (TOKEN_ENV_VAR, token_path))
+        return token
+
+    # Try to load active token
+    token = _read_token(TOKEN_PATH)
+    if token is None:
+        raise TokenError("No API token found")
+    return token
+
+
+def _get_active_token_path(private_key, token_path):
+    if private_key:
+        return None
 
-    raise TokenError("No API token found")
+    if token_path is not None:
+        if not os.path.isfile(token_path):
+            raise TokenError(
+                "No file found at '%s=%s'" % (TOKEN_ENV_VAR, token_path))
+    elif os.path.isfile(TOKEN_PATH):
+        token_path = TOKEN_PATH
+
+    return token_path
 
 
 def _load_token_from_path(token_path):
-    if not os.path.isfile(token_path):
+    token = _read_token(token_path)
+    if token is None:
         raise TokenError("No file found at '%s'" % token_path)
+    return token
+
+
+def _read_token(token_path):
+    # Returns None, rather than raising, if no token file exists at the path
+    global _cached_token
 
     try:
-        return Token.from_json(token_path)
-    except IOError:
-        raise TokenError("File '%s' is not a valid API token" % token_path)
+        st = os.stat(token_path)
+    except OSError:
+        return None
+    if not stat.S_ISREG(st.st_mode):
+        return None
+
+    key = (os.path.abspath(token_path), st.st_mtime, st.st_size)
+
+    cached = _cached_token
+    if cached is not None and cached[0] == key:
+        return cached[1]
+
+    with _cached_token_lock:
+        cached = _cached_token
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        try:
+            token = Token.from_json(token_path)
+        except IOError:
+            raise TokenError("File '%s' is not a valid API token" % token_path)
+
+        _cached_token = (key, token)
+        return token
+
+
+def _clear_cached_token():
+    global _cached_token
+
+    with _cached_token_lock:
+        _cached_token = None
 
 
 class Token(object):
@@ -163,6 +228,7 @@ class Token(object):
         self.id = access_token.get("token_id", None)
         self.private_key = access_token["private_key"]
         self._token_dict = token_dict
+        self._header = self._make_header()
 
     def __str__(self):
         return voxu.json_to_str(self._token_dict)
@@ -174,7 +240,7 @@ class Token(object):
         Returns:
             a header dictionary
         '''
-        return {"Authorization": "Bearer " + self.private_key}
+        return self._header.copy()
 
     @classmethod
     def from_json(cls, path):
@@ -231,6 +297,9 @@ class Token(object):
             }
         })
 
+    def _make_header(self):
+        return {AUTH_HEADER: "Bearer " + self.private_key}
+
     @staticmethod
     def _parse_base_api_url(access_token):
         base_api_url = access_token.get("base_api_url", None)
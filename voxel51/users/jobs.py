@@ -13,7 +13,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 from builtins import *
-from future.utils import iteritems
 # pragma pylint: enable=redefined-builtin
 # pragma pylint: enable=unused-wildcard-import
 # pragma pylint: enable=wildcard-import
@@ -150,11 +149,11 @@ class JobRequest(voxu.Serializable):
         job_request = cls(analytic, version=version, compute_mode=compute_mode)
 
         # Set inputs
-        for name, val in iteritems(d.get("inputs", {})):
+        for name, val in d.get("inputs", {}).items():
             job_request.set_input(name, path=RemoteDataPath.from_dict(val))
 
         # Set parameters
-        for name, val in iteritems(d.get("parameters", {})):
+        for name, val in d.get("parameters", {}).items():
             if RemoteDataPath.is_remote_path_dict(val):
                 # Data parameter
                 job_request.set_data_parameter(
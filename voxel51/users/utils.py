@@ -13,7 +13,6 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import unicode_literals
 from builtins import *
-from future.utils import iteritems
 import six
 # pragma pylint: enable=redefined-builtin
 # pragma pylint: enable=unused-wildcard-import
@@ -27,6 +26,11 @@ import sys
 
 from requests_toolbelt.multipart.encoder import MultipartEncoder
 
+try:
+    import orjson  # optional, but much faster for large JSON payloads
+except ImportError:
+    orjson = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +69,12 @@ def load_json(str_or_bytes):
     Returns:
         a JSON list/dictionary
     '''
+    if orjson is not None:
+        try:
+            return orjson.loads(str_or_bytes)
+        except orjson.JSONDecodeError:
+            pass  # e.g., NaN values, which only `json` accepts
+
     try:
         return json.loads(str_or_bytes)
     except TypeError:
@@ -373,7 +383,7 @@ class Serializable(object):
         '''
         return {
             v: _recurse(getattr(self, k))
-            for k, v in iteritems(self._attributes())
+            for k, v in self._attributes().items()
         }
 
     def to_str(self):
@@ -450,7 +460,7 @@ def _recurse(v):
     if isinstance(v, list):
         return [_recurse(vi) for vi in v]
     if isinstance(v, dict):
-        return {ki: _recurse(vi) for ki, vi in iteritems(v)}
+        return {ki: _recurse(vi) for ki, vi in v.items()}
     if isinstance(v, Serializable):
         return v.to_dict()
     return v